@@ -5,8 +5,10 @@ import json
 import os
 import uuid
 from werkzeug.utils import secure_filename
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify
 import generation_cv  # Importa il modulo generation_cv esistente per la generazione del CV
+import skill_taxonomy  # Normalizzazione e deduplicazione delle competenze
+import cv_matching  # Matching tra profili e requisiti di un'offerta di lavoro
 
 app = Flask(__name__, static_folder='static')
 app.secret_key = "cv-update-secret-key"  # Chiave segreta per i messaggi flash
@@ -33,10 +35,28 @@ def load_cv_data(lang='it'):
     with open(file_path, 'r', encoding='utf-8') as file:
         return json.load(file)
 
+# Profili salvati indicizzati per il matching (id profilo -> file JSON)
+PROFILE_PATHS = {'it': CV_JSON_PATH, 'en': 'cv_en.json'}
+
+def build_profile_index():
+    """Costruisce l'indice dei profili a partire dai file JSON salvati."""
+    index = cv_matching.ProfileIndex()
+    for profile_id, path in PROFILE_PATHS.items():
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                index.update(profile_id, json.load(file))
+    return index
+
+# Costruito all'avvio: ProfileIndex è thread-safe per aggiornamenti e query
+profile_index = build_profile_index()
+
 def save_cv_data(cv_data):
     """Salva i dati nel file JSON del CV."""
     with open(CV_JSON_PATH, 'w', encoding='utf-8') as file:
         json.dump(cv_data, file, indent=2, ensure_ascii=False)
+    
+    # Aggiorna solo il vettore del profilo salvato
+    profile_index.update('it', cv_data)
 
 @app.route('/')
 def index():
@@ -178,8 +198,13 @@ def update_skills():
     cv_data['skills']['software'] = [s.strip() for s in request.form['software_skills'].strip().split(',') if s.strip()]
     cv_data['skills']['devOps'] = [s.strip() for s in request.form['devops_skills'].strip().split(',') if s.strip()]
     
+    # Normalizza e deduplica le competenze prima del salvataggio
+    suggestions = skill_taxonomy.normalize_cv_skills(cv_data, sections=('skills',))
+    
     save_cv_data(cv_data)
     flash('Competenze aggiornate con successo!', 'success')
+    if suggestions:
+        flash(skill_taxonomy.format_suggestions(suggestions), 'warning')
     return redirect(url_for('index'))
 
 @app.route('/update/languages', methods=['POST'])
@@ -273,8 +298,13 @@ def update_other():
     cv_data['other']['hobbies'] = [h.strip() for h in request.form['hobbies'].strip().split(',') if h.strip()]
     cv_data['other']['qualities'] = [q.strip() for q in request.form['qualities'].strip().split(',') if q.strip()]
     
+    # Deduplica hobby e qualità prima del salvataggio
+    suggestions = skill_taxonomy.normalize_cv_skills(cv_data, sections=('other',))
+    
     save_cv_data(cv_data)
     flash('Altre informazioni aggiornate con successo!', 'success')
+    if suggestions:
+        flash(skill_taxonomy.format_suggestions(suggestions), 'warning')
     return redirect(url_for('index'))
 
 @app.route('/generate-cv')
@@ -306,6 +336,20 @@ def download_cv():
         flash('CV file not generated yet. Please generate the CV first.', 'warning')
         return redirect(url_for('index', lang=lang))
 
+@app.route('/match')
+def match_profiles():
+    """Restituisce i profili più adatti ai requisiti (separati da virgola) in formato JSON."""
+    requirements = [r.strip() for r in request.args.get('requirements', '').split(',') if r.strip()]
+    k = request.args.get('k', '10')
+    if not requirements:
+        return jsonify({'error': 'Specificare almeno un requisito'}), 400
+    if not k.isdigit() or int(k) <= 0:
+        return jsonify({'error': 'Il parametro k deve essere un intero positivo'}), 400
+    if not profile_index.profile_ids:
+        return jsonify({'error': 'Nessun profilo salvato da confrontare'}), 404
+    results = profile_index.query(requirements, int(k))
+    return jsonify({'requirements': requirements, 'results': results})
+
 @app.route('/upload-photo', methods=['POST'])
 def upload_photo():
     """Gestisce l'upload della foto profilo."""
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+import threading
+import numpy as np
+from scipy import sparse
+import skill_taxonomy
+
+# Peso di ciascuna sezione del CV nel punteggio finale
+FIELD_WEIGHTS = {
+    'skills': 1.0,
+    'achievements': 0.5,
+    'languages': 1.0,
+    'digitalSkills': 0.5,
+}
+
+# Livelli testuali e CEFR convertiti in un valore tra 0 e 1
+LEVEL_SCORES = {
+    'native': 1.0, 'madrelingua': 1.0,
+    'c2': 1.0, 'c1': 0.9, 'b2': 0.75, 'b1': 0.6, 'a2': 0.4, 'a1': 0.25,
+    'excellent': 0.9, 'ottimo': 0.9, 'eccellente': 0.9,
+    'very good': 0.8, 'molto buono': 0.8,
+    'good': 0.7, 'buono': 0.7,
+    'moderately good': 0.6, 'discreto': 0.6,
+    'fair': 0.5, 'sufficiente': 0.5,
+    'basic': 0.3, 'base': 0.3,
+}
+DEFAULT_LEVEL = 0.5
+
+_LEVEL_WORDS = '|'.join(sorted((re.escape(k) for k in LEVEL_SCORES), key=len, reverse=True))
+_LEVEL_PATTERN = re.compile(r'\b(' + _LEVEL_WORDS + r')\b')
+# Livello in coda a un requisito (es. "English C1", "Problem solving: good")
+_TRAILING_LEVEL = re.compile(r'^(.*?\S)[\s,:(-]+(' + _LEVEL_WORDS + r')\)?$')
+# Lunghezza massima (in parole) dei termini cercati nel testo degli achievement
+_MAX_NGRAM = 3
+
+
+def level_score(level):
+    """Converte un livello testuale (es. "B1-B2 (Fair)") nel valore più alto riconosciuto."""
+    found = _LEVEL_PATTERN.findall(level.casefold())
+    return max(LEVEL_SCORES[f] for f in found) if found else DEFAULT_LEVEL
+
+
+def _term_key(value):
+    """Chiave di un termine: nome canonico (anche tramite alias) normalizzato."""
+    return skill_taxonomy.normalize_key(skill_taxonomy.resolve_alias(value) or value)
+
+
+# Competenze del dizionario canonico cercate nel testo degli achievement
+TAXONOMY_TERMS = frozenset(_term_key(name) for name in skill_taxonomy.CANONICAL_SKILLS)
+
+
+def _skill_entries(skills):
+    """Restituisce tutte le voci delle liste di competenze (annidate comprese)."""
+    if isinstance(skills, list):
+        return list(skills)
+    if isinstance(skills, dict):
+        return [entry for value in skills.values() for entry in _skill_entries(value)]
+    return []
+
+
+def _mentioned_terms(text, vocabulary):
+    """Cerca nel testo le competenze del vocabolario (n-grammi fino a _MAX_NGRAM parole)."""
+    words = skill_taxonomy.normalize_key(text).split()
+    found = set()
+    for size in range(1, _MAX_NGRAM + 1):
+        for i in range(len(words) - size + 1):
+            key = _term_key(' '.join(words[i:i + size]))
+            if key in vocabulary:
+                found.add(key)
+    return found
+
+
+def extract_features(cv_data):
+    """Estrae i termini pesati di un profilo come dizionario {(sezione, termine): peso}.
+
+    Negli achievement si cercano solo le competenze del dizionario canonico e
+    quelle dichiarate dal profilo stesso, così il risultato non dipende dagli
+    altri profili indicizzati.
+    """
+    features = {}
+    own_skills = {_term_key(entry) for entry in _skill_entries(cv_data.get('skills', {}))}
+    for key in own_skills:
+        features[('skills', key)] = 1.0
+
+    vocabulary = TAXONOMY_TERMS | own_skills
+    for work in cv_data.get('work', []):
+        for achievement in work.get('achievements', []):
+            for key in _mentioned_terms(achievement, vocabulary):
+                features[('achievements', key)] = 1.0
+
+    # I valori null nel JSON vengono trattati come stringhe vuote
+    for language in cv_data.get('languages', []):
+        features[('languages', _term_key(language.get('language') or ''))] = level_score(language.get('level') or '')
+
+    for digital in cv_data.get('digitalSkills', []):
+        features[('digitalSkills', _term_key(digital.get('skill') or ''))] = level_score(digital.get('level') or '')
+
+    return {k: v for k, v in features.items() if k[1]}
+
+
+# Sezioni in cui il livello del candidato viene confrontato con quello richiesto
+LEVEL_FIELDS = ('languages', 'digitalSkills')
+
+
+class ProfileIndex:
+    """Indice dei profili come matrice sparsa (profili x termini) aggiornata in modo incrementale.
+
+    Ogni profilo conserva le proprie colonne non nulle; la matrice CSR viene
+    ricostruita solo alla prima interrogazione dopo una modifica. Tutti i metodi
+    pubblici sono protetti da un lock e possono essere usati da più thread.
+    """
+
+    def __init__(self):
+        self.profile_ids = []
+        self._rows = {}
+        self._row_features = []
+        self._columns = {}
+        self._matrix = None
+        self._lock = threading.Lock()
+
+    def _column(self, feature):
+        """Restituisce la colonna di un termine, creandola se necessario."""
+        return self._columns.setdefault(feature, len(self._columns))
+
+    def _csr(self):
+        """Restituisce la matrice CSR dei profili, ricostruendola se è cambiata."""
+        if self._matrix is None:
+            lengths = np.fromiter((len(r) for r in self._row_features), dtype=np.int64,
+                                  count=len(self._row_features))
+            indptr = np.concatenate(([0], np.cumsum(lengths)))
+            indices = np.fromiter((c for r in self._row_features for c in r), dtype=np.int32,
+                                  count=int(indptr[-1]))
+            data = np.fromiter((v for r in self._row_features for v in r.values()), dtype=np.float32,
+                               count=int(indptr[-1]))
+            self._matrix = sparse.csr_matrix(
+                (data, indices, indptr), shape=(len(self._row_features), len(self._columns)))
+        return self._matrix
+
+    def update(self, profile_id, cv_data):
+        """Ricalcola il vettore di un singolo profilo (da chiamare a ogni salvataggio)."""
+        features = extract_features(cv_data)
+        with self._lock:
+            row_features = {self._column(feature): weight for feature, weight in features.items()}
+            if profile_id in self._rows:
+                # Sostituisce l'intera riga: i termini rimossi non restano nell'indice
+                self._row_features[self._rows[profile_id]] = row_features
+            else:
+                self._rows[profile_id] = len(self.profile_ids)
+                self.profile_ids.append(profile_id)
+                self._row_features.append(row_features)
+            self._matrix = None
+
+    def _parse_requirement(self, requirement):
+        """Separa un requisito in (termine, livello richiesto).
+
+        Il requisito completo ha la precedenza ("React Native", "Visual Basic");
+        solo se non corrisponde a nessun termine indicizzato viene separato un
+        livello in coda e il termine viene cercato solo tra lingue e competenze digitali.
+        """
+        key = _term_key(requirement)
+        if any((field, key) in self._columns for field in FIELD_WEIGHTS):
+            return key, None
+        match = _TRAILING_LEVEL.match(requirement.strip().casefold())
+        if not match:
+            return key, None
+        return _term_key(match.group(1)), LEVEL_SCORES[match.group(2)]
+
+    def query(self, requirements, top_k=10):
+        """Assegna un punteggio a tutti i profili rispetto ai requisiti in un'unica operazione.
+
+        Per lingue e competenze digitali con un livello richiesto (es. "English C1")
+        il punteggio è min(1, livello del candidato / livello richiesto).
+        Restituisce i migliori top_k profili con il punteggio, i requisiti
+        soddisfatti per sezione ("matches") e quelli con livello insufficiente ("partial").
+        """
+        with self._lock:
+            if not self.profile_ids or top_k <= 0:
+                return []
+
+            keys, labels, levels = [], [], []
+            for requirement in requirements:
+                key, level = self._parse_requirement(requirement)
+                if key and key not in keys:
+                    keys.append(key)
+                    labels.append(requirement.strip())
+                    levels.append(level)
+            if not keys:
+                return []
+            matrix = self._csr()
+
+            # Matrice colonne x requisiti con il peso della sezione di ciascun termine
+            query = np.zeros((matrix.shape[1], len(keys)), dtype=np.float32)
+            targets = []
+            for j, key in enumerate(keys):
+                for field, weight in FIELD_WEIGHTS.items():
+                    column = self._columns.get((field, key))
+                    if column is None:
+                        continue
+                    # Un livello separato dal requisito vale solo per lingue e competenze digitali
+                    required = levels[j]
+                    if required and field not in LEVEL_FIELDS:
+                        continue
+                    query[column, j] = weight / required if required else weight
+                    targets.append((j, field, column, required))
+
+            # Un solo prodotto matrice sparsa x densa; ogni requisito vale al massimo 1
+            scores = np.minimum(matrix @ query, 1.0).mean(axis=1)
+
+            # Solo i profili con almeno un requisito soddisfatto, a parità di
+            # punteggio nell'ordine di inserimento
+            candidates = np.flatnonzero(scores > 0)
+            top = candidates[np.argsort(-scores[candidates], kind='stable')[:top_k]]
+
+            results = []
+            for row in top:
+                row_features = self._row_features[row]
+                matches, partial = {}, {}
+                for j, field, column, required in targets:
+                    value = row_features.get(column, 0.0)
+                    if value <= 0:
+                        continue
+                    target = matches if required is None or value >= required else partial
+                    target.setdefault(field, []).append(labels[j])
+                results.append({
+                    'profile': self.profile_ids[row],
+                    'score': round(float(scores[row]), 4),
+                    'matches': matches,
+                    'partial': partial,
+                })
+            return results
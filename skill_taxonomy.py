@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+# Dizionario canonico delle competenze: nome canonico -> alias conosciuti
+# (solo alias non ambigui: sigle brevi come "vs" o "ts" non vengono riconosciute)
+CANONICAL_SKILLS = {
+    # AI
+    'Machine Learning': ['machine-learning', 'apprendimento automatico'],
+    'TensorFlow': ['tensor flow'],
+    'PyTorch': ['torch', 'py torch'],
+    'Hugging Face': ['huggingface'],
+    'LLM Integration': ['integrazione llm'],
+    'Vector Database': ['vector db', 'vectordb', 'database vettoriale'],
+    'Ollama': [],
+    'n8n': ['n8n.io'],
+    # Programmazione
+    'C#': ['csharp', 'c sharp'],
+    'C++': ['cpp', 'cplusplus'],
+    'Python': ['python3'],
+    'Batch': ['batch script'],
+    'PowerShell': ['pwsh'],
+    'HTML': ['html5'],
+    'CSS': ['css3'],
+    'JavaScript': ['java script', 'ecmascript'],
+    'TypeScript': ['type script'],
+    'VBA': ['visual basic for applications'],
+    # Automazione industriale
+    'PLC': ['plc programming', 'programmazione plc'],
+    'KOP': ['ladder'],
+    'AWL': [],
+    'SCL': [],
+    'HMI Configuration': ['configurazione hmi'],
+    # Software
+    'Visual Studio': [],
+    'Visual Studio Code': ['vscode', 'vs code'],
+    'DevExpress': ['dev express'],
+    'Microsoft Office': ['ms office'],
+    'GitHub': ['github.com'],
+    'GitHub Copilot': [],
+    'Git': [],
+    'AuditPlus': ['audit plus'],
+    'vSphere': ['vsphire', 'vmware vsphere'],
+    'Veeam': ['veeam backup'],
+    'Acronis': [],
+    'UltraVNC': ['ultra vnc'],
+    'KeePass': [],
+    'GLPI': [],
+    'Libra Esva': ['libraesva'],
+    # DevOps
+    'SQL': [],
+    'MySQL': ['my sql'],
+    'SQLite': ['sqlite3'],
+    'Docker': ['docker engine'],
+    'Portainer': [],
+    'Linux': ['gnu/linux'],
+}
+
+# Soglia di similarità oltre la quale due voci vengono proposte per l'unione
+FUZZY_THRESHOLD = 0.85
+
+# Separatori che indicano voci composte (es. "Docker/Portainer"); il "+" separa
+# solo se circondato da spazi, per non spezzare nomi come "C++" o "Notepad++"
+_COMPOUND_SPLIT = re.compile(r'\s*[/|&]\s*|\s+\+\s+|\s+e\s+|\s+and\s+')
+# Caratteri ignorati nella chiave di confronto (mantiene # + . per C#, C++, .NET)
+_STRIP_CHARS = re.compile(r'[^\w#+.\s]')
+
+
+def normalize_key(value):
+    """Restituisce la chiave di confronto di una voce (minuscolo, spazi compattati)."""
+    key = _STRIP_CHARS.sub(' ', value.casefold())
+    return ' '.join(key.split()).strip('.')
+
+
+def _trigrams(key):
+    """Restituisce i trigrammi di una chiave, usati per l'indice fuzzy."""
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _build_indexes():
+    """Precalcola gli indici esatti (nomi canonici e alias) e l'indice dei trigrammi."""
+    canonical_index = {}
+    alias_index = {}
+    trigram_index = {}
+    for canonical, aliases in CANONICAL_SKILLS.items():
+        canonical_index[normalize_key(canonical)] = canonical
+        for name in [canonical] + aliases:
+            key = normalize_key(name)
+            alias_index.setdefault(key, canonical)
+            for gram in _trigrams(key):
+                trigram_index.setdefault(gram, set()).add(key)
+    return canonical_index, alias_index, trigram_index
+
+
+_CANONICAL_INDEX, _EXACT_INDEX, _TRIGRAM_INDEX = _build_indexes()
+
+
+@lru_cache(maxsize=4096)
+def canonicalize(value):
+    """Restituisce il nome canonico se la voce differisce solo per maiuscole/spazi, altrimenti la voce ripulita."""
+    cleaned = ' '.join(value.split())
+    return _CANONICAL_INDEX.get(normalize_key(cleaned), cleaned)
+
+
+@lru_cache(maxsize=4096)
+def resolve_alias(value):
+    """Restituisce il nome canonico corrispondente a un nome o alias conosciuto, altrimenti None."""
+    return _EXACT_INDEX.get(normalize_key(value))
+
+
+def _closest(key, candidates):
+    """Restituisce il candidato più simile a key oltre FUZZY_THRESHOLD, altrimenti None."""
+    best, best_ratio = None, FUZZY_THRESHOLD
+    for candidate in candidates:
+        ratio = SequenceMatcher(None, key, candidate).ratio()
+        if ratio >= best_ratio:
+            best, best_ratio = candidate, ratio
+    return best
+
+
+def _trigram_candidates(key, trigram_index, limit=10):
+    """Restituisce le chiavi dell'indice con più trigrammi in comune con key."""
+    counts = {}
+    for gram in _trigrams(key):
+        for candidate in trigram_index.get(gram, ()):
+            if candidate != key:
+                counts[candidate] = counts.get(candidate, 0) + 1
+    return sorted(counts, key=counts.get, reverse=True)[:limit]
+
+
+@lru_cache(maxsize=4096)
+def fuzzy_match(value):
+    """Cerca nel dizionario la competenza canonica più simile alla voce.
+
+    Restituisce il nome canonico oppure None se nessuna voce supera FUZZY_THRESHOLD.
+    """
+    key = normalize_key(value)
+    if not key:
+        return None
+    if key in _EXACT_INDEX:
+        return _EXACT_INDEX[key]
+    # I trigrammi in comune limitano il confronto a pochi candidati
+    best = _closest(key, _trigram_candidates(key, _TRIGRAM_INDEX))
+    return _EXACT_INDEX[best] if best else None
+
+
+def normalize_list(values, use_taxonomy=True):
+    """Normalizza e deduplica una lista di voci mantenendo l'ordine originale.
+
+    Le voci vengono solo ripulite (spazi, maiuscole dei nomi canonici): alias,
+    refusi e voci composte non vengono modificati ma restituiti come suggerimenti.
+    Restituisce una tupla (voci_normalizzate, suggerimenti) dove i suggerimenti
+    sono coppie (voce, proposta) da unire manualmente.
+    """
+    result = []
+    seen = {}
+    list_trigrams = {}
+    for value in values:
+        item = canonicalize(value) if use_taxonomy else ' '.join(value.split())
+        key = normalize_key(item)
+        if not key or key in seen:
+            continue
+        seen[key] = item
+        result.append(item)
+        for gram in _trigrams(key):
+            list_trigrams.setdefault(gram, set()).add(key)
+
+    suggestions = []
+    for item in result:
+        key = normalize_key(item)
+        if use_taxonomy and key not in _CANONICAL_INDEX:
+            # Alias conosciuto di una competenza canonica (es. "vscode")
+            alias = resolve_alias(item)
+            if alias:
+                suggestions.append((item, alias))
+                continue
+            # Voce composta con parti già presenti (es. "Docker/Portainer")
+            parts = [p for p in _COMPOUND_SPLIT.split(item) if p]
+            if len(parts) > 1:
+                known = [seen[normalize_key(canonicalize(p))] for p in parts
+                         if normalize_key(canonicalize(p)) in seen]
+                if known:
+                    suggestions.append((item, ', '.join(known)))
+                    continue
+            # Voce sconosciuta ma simile a una competenza canonica
+            match = fuzzy_match(item)
+            if match:
+                suggestions.append((item, match))
+                continue
+        # Voci simili all'interno della stessa lista (es. refusi), confrontate
+        # solo con i candidati che condividono trigrammi; ogni coppia una volta
+        candidates = [c for c in _trigram_candidates(key, list_trigrams) if c < key]
+        other = _closest(key, candidates)
+        if other:
+            suggestions.append((item, seen[other]))
+    return result, suggestions
+
+
+def normalize_cv_skills(cv_data, sections=('skills', 'other')):
+    """Normalizza in place le sezioni indicate del CV ("skills" e/o "other").
+
+    Restituisce la lista dei suggerimenti di unione come tuple (sezione, voce, proposta).
+    """
+    suggestions = []
+
+    def apply(container, field, section, use_taxonomy=True):
+        if isinstance(container.get(field), list):
+            container[field], found = normalize_list(container[field], use_taxonomy)
+            suggestions.extend((section, item, proposal) for item, proposal in found)
+
+    if 'skills' in sections:
+        skills = cv_data.get('skills', {})
+        for field in ('ai', 'industrialAutomation', 'software', 'devOps'):
+            apply(skills, field, field)
+
+        programming = skills.get('programming', {})
+        for field in ('advanced', 'intermediate', 'basic'):
+            apply(programming, field, f'programming.{field}')
+
+    # Hobby e qualità non hanno un dizionario canonico: solo deduplicazione
+    if 'other' in sections:
+        other = cv_data.get('other', {})
+        for field in ('hobbies', 'qualities'):
+            apply(other, field, field, use_taxonomy=False)
+
+    return suggestions
+
+
+def format_suggestions(suggestions, limit=5):
+    """Restituisce un messaggio leggibile con i suggerimenti di unione."""
+    shown = [f'"{item}" → "{proposal}" ({section})' for section, item, proposal in suggestions[:limit]]
+    if len(suggestions) > limit:
+        shown.append(f'altri {len(suggestions) - limit}')
+    return 'Possibili duplicati da unire: ' + '; '.join(shown)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import cv_matching
+
+
+def make_profile(skills=(), achievements=(), languages=(), digital=()):
+    return {
+        'skills': {'devOps': list(skills)},
+        'work': [{'achievements': list(achievements)}],
+        'languages': [{'language': name, 'level': level} for name, level in languages],
+        'digitalSkills': [{'skill': name, 'level': level} for name, level in digital],
+    }
+
+
+def test_update_then_query_orders_by_score():
+    index = cv_matching.ProfileIndex()
+    index.update('a', make_profile(skills=['Docker']))
+    index.update('b', make_profile(skills=['Docker', 'Python']))
+    index.update('c', make_profile(skills=['Rust']))
+
+    results = index.query(['Docker', 'Python'], top_k=2)
+    assert [r['profile'] for r in results] == ['b', 'a']
+    assert [r['score'] for r in results] == [1.0, 0.5]
+
+
+def test_resave_clears_removed_terms():
+    index = cv_matching.ProfileIndex()
+    index.update('a', make_profile(skills=['Docker', 'Python']))
+    index.update('a', make_profile(skills=['Python']))
+
+    assert index.profile_ids == ['a']
+    assert index.query(['Docker'], top_k=1) == []
+    assert index.query(['Python'], top_k=1)[0]['matches'] == {'skills': ['Python']}
+
+
+def test_explanation_lists_matches_per_section():
+    index = cv_matching.ProfileIndex()
+    index.update('a', make_profile(
+        skills=['Docker'],
+        achievements=['Linux server configuration for docker with portainer'],
+        languages=[('English', 'C2')],
+        digital=[('Problem solving', 'Excellent')],
+    ))
+
+    result = index.query(['Docker', 'Portainer', 'English', 'Problem solving'])[0]
+    assert result['matches'] == {
+        'skills': ['Docker'],
+        'achievements': ['Docker', 'Portainer'],
+        'languages': ['English'],
+        'digitalSkills': ['Problem solving'],
+    }
+    assert result['partial'] == {}
+
+
+def test_required_language_level():
+    index = cv_matching.ProfileIndex()
+    index.update('fluent', make_profile(languages=[('English', 'C2')]))
+    index.update('intermediate', make_profile(languages=[('English', 'B1-B2 (Fair)')]))
+    index.update('beginner', make_profile(languages=[('English', 'A1')]))
+
+    results = {r['profile']: r for r in index.query(['English C1'])}
+    assert results['fluent']['score'] == 1.0
+    assert results['fluent']['matches'] == {'languages': ['English C1']}
+    assert results['intermediate']['score'] < 1.0
+    assert results['intermediate']['matches'] == {}
+    assert results['intermediate']['partial'] == {'languages': ['English C1']}
+    assert results['beginner']['score'] < results['intermediate']['score']
+
+
+def test_achievement_terms_do_not_depend_on_other_profiles():
+    profile = make_profile(achievements=['Deployed services with Nomad'])
+    alone = cv_matching.extract_features(profile)
+
+    index = cv_matching.ProfileIndex()
+    index.update('a', make_profile(skills=['Nomad']))
+    index.update('b', profile)
+    assert cv_matching.extract_features(profile) == alone
+    assert [r['profile'] for r in index.query(['Nomad'])] == ['a']
+
+
+def test_level_words_inside_skill_names():
+    index = cv_matching.ProfileIndex()
+    index.update('react', make_profile(skills=['React']))
+    index.update('native', make_profile(skills=['React Native']))
+    index.update('vb', make_profile(skills=['Visual Basic']))
+    index.update('english', make_profile(languages=[('English', 'C1')]))
+
+    assert [r['profile'] for r in index.query(['React Native'])] == ['native']
+    assert [r['profile'] for r in index.query(['Visual Basic'])] == ['vb']
+    assert [r['profile'] for r in index.query(['English C1'])] == ['english']
+
+
+def test_top_k_skips_zero_scores_and_keeps_insertion_order():
+    index = cv_matching.ProfileIndex()
+    for i in range(50):
+        index.update(i, make_profile(skills=['Docker'] if i in (30, 40, 45) else ['Python']))
+
+    assert [r['profile'] for r in index.query(['Docker'], top_k=3)] == [30, 40, 45]
+    assert [r['profile'] for r in index.query(['Docker'], top_k=2)] == [30, 40]
+
+
+def test_null_fields_are_ignored():
+    profile = make_profile(languages=[('English', None), (None, 'B2')], digital=[('Security', None)])
+    index = cv_matching.ProfileIndex()
+    index.update('a', profile)
+    assert index.query(['English'])[0]['score'] == cv_matching.DEFAULT_LEVEL
+
+
+def test_invalid_top_k_returns_nothing():
+    index = cv_matching.ProfileIndex()
+    index.update('a', make_profile(skills=['Docker']))
+    assert index.query(['Docker'], top_k=0) == []
+
+
+def test_query_many_profiles_is_fast():
+    pool = [f'Skill {i}' for i in range(20000)]
+    index = cv_matching.ProfileIndex()
+    for i in range(20000):
+        index.update(i, make_profile(skills=pool[i:i + 5], languages=[('English', 'B2')]))
+
+    # La prima query ricostruisce la matrice CSR; si misura quella successiva
+    requirements = ['Skill 100', 'Skill 101', 'English C1']
+    index.query(requirements, top_k=10)
+    start = time.perf_counter()
+    results = index.query(requirements, top_k=10)
+    assert time.perf_counter() - start < 1.0
+    assert results[0]['profile'] in (97, 98, 99, 100)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import skill_taxonomy
+
+
+def test_docker_duplicates_and_compound():
+    """"Docker" e "docker " vengono uniti, "Docker/Portainer" viene solo suggerito."""
+    result, suggestions = skill_taxonomy.normalize_list(['Docker', 'docker ', 'Docker/Portainer'])
+    assert result == ['Docker', 'Docker/Portainer']
+    assert suggestions == [('Docker/Portainer', 'Docker')]
+
+
+def test_compound_keeps_plus_in_names():
+    """Il "+" di "C++" non separa la voce composta."""
+    result, suggestions = skill_taxonomy.normalize_list(['C++/C#', 'C', 'C#', 'Notepad++'])
+    assert result == ['C++/C#', 'C', 'C#', 'Notepad++']
+    assert suggestions == [('C++/C#', 'C#')]
+
+    _, suggestions = skill_taxonomy.normalize_list(['Docker + Portainer', 'Docker'])
+    assert suggestions == [('Docker + Portainer', 'Docker')]
+
+
+def test_case_only_differences_are_canonicalized():
+    result, suggestions = skill_taxonomy.normalize_list(['pytorch', 'GITHUB', 'Github'])
+    assert result == ['PyTorch', 'GitHub']
+    assert suggestions == []
+
+
+def test_aliases_are_suggested_not_rewritten():
+    result, suggestions = skill_taxonomy.normalize_list(['vscode', 'csharp'])
+    assert result == ['vscode', 'csharp']
+    assert suggestions == [('vscode', 'Visual Studio Code'), ('csharp', 'C#')]
+
+
+def test_ambiguous_short_names_are_left_alone():
+    values = ['vs', 'Office', 'VNC', 'ts']
+    assert skill_taxonomy.normalize_list(values) == (values, [])
+
+
+def test_near_miss_spellings():
+    result, suggestions = skill_taxonomy.normalize_list(['Tensorflw', 'Kubernetes', 'Kubernetess'])
+    assert result == ['Tensorflw', 'Kubernetes', 'Kubernetess']
+    assert ('Tensorflw', 'TensorFlow') in suggestions
+    assert ('Kubernetess', 'Kubernetes') in suggestions
+
+
+def test_only_requested_sections_are_normalized():
+    cv_data = {
+        'skills': {'devOps': ['Docker', 'docker'], 'programming': {}},
+        'other': {'hobbies': ['Music', 'music '], 'qualities': ['Polite']},
+    }
+    skill_taxonomy.normalize_cv_skills(cv_data, sections=('other',))
+    assert cv_data['skills']['devOps'] == ['Docker', 'docker']
+    assert cv_data['other']['hobbies'] == ['Music']
+
+    skill_taxonomy.normalize_cv_skills(cv_data, sections=('skills',))
+    assert cv_data['skills']['devOps'] == ['Docker']
+
+
+def test_hobbies_and_qualities_skip_taxonomy():
+    cv_data = {'other': {'hobbies': ['docker', 'Tensorflw'], 'qualities': ['vscode']}}
+    suggestions = skill_taxonomy.normalize_cv_skills(cv_data, sections=('other',))
+    assert cv_data['other'] == {'hobbies': ['docker', 'Tensorflw'], 'qualities': ['vscode']}
+    assert suggestions == []